@@ -0,0 +1,9 @@
+"""
+Общая конфигурация pytest для автотестов Postman Echo.
+"""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+    )
@@ -8,30 +8,234 @@
 Автор: Березина Анастасия
 """
 
-import json
+import asyncio
+import fastjsonschema
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 import requests
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any
 
 
+# Таймаут (в секундах) для всех HTTP запросов к сервису
+TIMEOUT = 30
+
+
+def _json(response):
+    """Декодирует JSON тело ответа через orjson."""
+    return orjson.loads(response.content)
+
+
+# Неизменяемые тестовые данные собираются один раз при импорте модуля
+_BASIC_PARAMS = {
+    'name': 'Иван Иванов',
+    'age': '29',
+    'city': 'Moscow',
+    'is_student': 'false',
+    'email': 'test@example.com'
+}
+
+_QUERY_PARAMS = MappingProxyType({
+    'search': 'python testing',
+    'category': 'programming',
+    'level': 'advanced',
+    'duration_min': '30',
+    'duration_max': '120',
+    'language': 'ru',
+    'format': 'json',
+    'sort_by': 'relevance',
+    'order': 'desc',
+    'page': '1',
+    'limit': '20',
+    'include_archived': 'false',
+    'tags': 'api,testing,automation'
+})
+
+_TEST_DATA_BASE = {
+    'user': {
+        'id': 12345,
+        'name': 'Тестовый Пользователь',
+        'profile': {
+            'age': 30,
+            'city': 'Санкт-Петербург',
+            'interests': ['programming', 'testing', 'automation']
+        }
+    },
+    'test_type': 'json_post_test',
+    'numbers': [1, 2, 3, 4, 5],
+    'boolean_flag': True,
+    'null_value': None
+}
+
+_FORM_DATA = {
+    'username': 'test_user_123',
+    'password': 'SecurePassword!@#',
+    'email': 'user@тест.рф',
+    'age': '28',
+    'terms_accepted': 'on',
+    'comments': 'Комментарий с кириллицей и спецсимволами: !@#$%^&*()'
+}
+
+# X-Request-ID добавляется к заголовкам в момент отправки запроса
+_CUSTOM_HEADERS_BASE = {
+    'X-Test-Header': 'TestValue123',
+    'X-User-Agent': 'CustomAgent/1.0',
+    'X-Client-Version': '2.1.0',
+    'X-Special-Chars': 'Value with spaces and symbols: !@#$%'
+}
+
+
+# Схема ответа GET /get, компилируется в функцию проверки при импорте;
+# ошибку валидации _assert_get_basic превращает в pytest.fail с описанием на русском
+_GET_SCHEMA = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['args', 'headers', 'url'],
+    'properties': {
+        'args': {'type': 'object'},
+        'headers': {'type': 'object'},
+        'url': {'type': 'string'}
+    }
+})
+
+
+def _custom_headers():
+    """Кастомные заголовки запроса с уникальным X-Request-ID."""
+    return {**_CUSTOM_HEADERS_BASE, 'X-Request-ID': f"req_{time.time_ns() // 1_000_000_000}"}
+
+
+# Проверки ответов общие для синхронных (requests) и асинхронных (httpx) тестов
+def _assert_get_basic(response, expected_url):
+    """Проверяет ответ на GET /get без параметров."""
+    assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+    
+    assert response.headers.get('content-type').startswith('application/json'), \
+        "Ответ должен быть в JSON формате"
+    
+    data = _json(response)
+    
+    # Проверяем обязательные поля
+    try:
+        _GET_SCHEMA(data)
+    except fastjsonschema.JsonSchemaException as exc:
+        pytest.fail(f"Структура ответа не соответствует схеме: {exc}")
+    
+    assert data['url'] == expected_url, f"URL в ответе не совпадает: {data['url']}"
+    
+    assert data['args'] == {}, "Args должен быть пустым для запроса без параметров"
+
+
+def _assert_query_parameters(response, test_params):
+    """Проверяет echo query параметров в ответе на GET /get."""
+    assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+    
+    data = _json(response)
+    
+    returned_args = data['args']
+    
+    for key, expected_value in test_params.items():
+        assert key in returned_args, f"Параметр '{key}' не найден в ответе"
+        assert returned_args[key] == expected_value, \
+            f"Параметр '{key}': ожидалось '{expected_value}', получено '{returned_args[key]}'"
+    
+    assert '?' in data['url'], "URL должен содержать query параметры"
+
+
+def _assert_post_json(response, test_data):
+    """Проверяет echo JSON тела в ответе на POST /post."""
+    assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+    
+    data = _json(response)
+    
+    assert 'data' in data, "В ответе должно быть поле 'data'"
+    assert 'json' in data, "В ответе должно быть поле 'json'"
+    assert 'headers' in data, "В ответе должно быть поле 'headers'"
+    
+    returned_json = data['json']
+    assert returned_json == test_data, "Возвращённые JSON данные не совпадают с отправленными"
+    
+    headers = data['headers']
+    assert 'content-type' in headers, "Заголовок Content-Type должен присутствовать"
+    assert 'application/json' in headers['content-type'], \
+        "Content-Type должен содержать application/json"
+
+
+def _assert_post_form(response, form_data):
+    """Проверяет echo form-data в ответе на POST /post."""
+    assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+    
+    data = _json(response)
+    
+    assert 'form' in data, "В ответе должно быть поле 'form'"
+    
+    returned_form = data['form']
+    
+    for key, expected_value in form_data.items():
+        assert key in returned_form, f"Поле формы '{key}' не найдено в ответе"
+        assert returned_form[key] == expected_value, \
+            f"Поле '{key}': ожидалось '{expected_value}', получено '{returned_form[key]}'"
+    
+    headers = data['headers']
+    assert 'content-type' in headers, "Заголовок Content-Type должен присутствовать"
+    assert 'application/x-www-form-urlencoded' in headers['content-type'], \
+        "Content-Type должен содержать application/x-www-form-urlencoded"
+
+
+def _assert_custom_headers(response, custom_headers):
+    """Проверяет echo кастомных заголовков: достаточно двух совпавших."""
+    assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+    
+    data = _json(response)
+    
+    assert 'headers' in data, "В ответе должно быть поле 'headers'"
+    
+    returned_headers = data['headers']
+    
+    expected_lower = {k.lower(): v for k, v in custom_headers.items()}
+    
+    found_custom_headers = 0
+    for header_name_lower, expected_value in expected_lower.items():
+        if header_name_lower in returned_headers:
+            found_custom_headers += 1
+            returned_value = returned_headers[header_name_lower]
+            assert returned_value == expected_value, \
+                f"Заголовок '{header_name_lower}': ожидалось '{expected_value}', получено '{returned_value}'"
+
+    assert found_custom_headers >= 2, "Не найдено хотя бы 2 кастомных заголовка"
+
+
+def _assert_multiple_query_parameters(response, query_params):
+    """Проверяет echo большого набора query параметров: состав и наличие в URL."""
+    assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+    
+    data = _json(response)
+    
+    returned_args = data['args']
+    
+    assert len(returned_args) == len(query_params), \
+        f"Количество параметров не совпадает: ожидалось {len(query_params)}, получено {len(returned_args)}"
+    
+    url = data['url']
+    for param_name, expected_value in query_params.items():
+        assert param_name in returned_args, f"Параметр '{param_name}' не найден в ответе"
+        assert returned_args[param_name] == expected_value, \
+            f"Параметр '{param_name}': ожидалось '{expected_value}', получено '{returned_args[param_name]}'"
+        assert param_name in url, f"Параметр '{param_name}' не найден в URL: {url}"
+
+
 class TestPostmanEcho:
     """Класс с тестами для Postman Echo API."""
     
     BASE_URL = "https://postman-echo.com"
-    TIMEOUT = 30
-    
-    @pytest.fixture(autouse=True)
-    def setup_session(self):
-        self.session = requests.Session()
-        self.session.timeout = self.TIMEOUT
-        
-        self.session.headers.update({
-            'User-Agent': 'PostmanEcho-AutoTest/1.0',
-            'Accept': 'application/json'
-        })
+    GET_URL = f"{BASE_URL}/get"
+    POST_URL = f"{BASE_URL}/post"
     
-    def test_get_basic_request(self):
+    def test_get_basic_request(self, baseline_get_response):
         """
         Тест 1: Базовый GET запрос без параметров.
         
@@ -40,27 +244,12 @@ class TestPostmanEcho:
         - Наличие обязательных полей в ответе
         - Корректность структуры JSON ответа
         """
-        # Отправляем GET запрос
-        response = self.session.get(f"{self.BASE_URL}/get")
-        
-        # Проверяем статус код
-        assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
-        
-        assert response.headers.get('content-type').startswith('application/json'), \
-            "Ответ должен быть в JSON формате"
+        # Ответ на GET запрос берём из кэша сессии
+        response = baseline_get_response
         
-        data = response.json()
-        
-        # Проверяем обязательные поля
-        assert 'args' in data, "В ответе должно быть поле 'args'"
-        assert 'headers' in data, "В ответе должно быть поле 'headers'"
-        assert 'url' in data, "В ответе должно быть поле 'url'"
-        
-        assert data['url'] == f"{self.BASE_URL}/get", f"URL в ответе не совпадает: {data['url']}"
-        
-        assert data['args'] == {}, "Args должен быть пустым для запроса без параметров"
+        _assert_get_basic(response, self.GET_URL)
     
-    def test_get_with_query_parameters(self):
+    def test_get_with_query_parameters(self, http_session):
         """
         Тест 2: GET запрос с query параметрами.
         
@@ -69,30 +258,13 @@ class TestPostmanEcho:
         - Различные типы данных в параметрах
         - Кодировку специальных символов
         """
-        test_params = {
-            'name': 'Иван Иванов',  
-            'age': '29',            
-            'city': 'Moscow',     
-            'is_student': 'false',  
-            'email': 'test@example.com'
-        }
+        test_params = _BASIC_PARAMS
         
-        response = self.session.get(f"{self.BASE_URL}/get", params=test_params)
+        response = http_session.get(self.GET_URL, params=test_params, timeout=TIMEOUT)
         
-        assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
-        
-        data = response.json()
-        
-        returned_args = data['args']
-        
-        for key, expected_value in test_params.items():
-            assert key in returned_args, f"Параметр '{key}' не найден в ответе"
-            assert returned_args[key] == expected_value, \
-                f"Параметр '{key}': ожидалось '{expected_value}', получено '{returned_args[key]}'"
-        
-        assert '?' in data['url'], "URL должен содержать query параметры"
+        _assert_query_parameters(response, test_params)
     
-    def test_post_json_data(self):
+    def test_post_json_data(self, http_session, test_timestamp):
         """
         Тест 3: POST запрос с JSON данными.
         
@@ -101,46 +273,18 @@ class TestPostmanEcho:
         - Корректное echo JSON данных
         - Обработку вложенных объектов и массивов
         """
-        test_data = {
-            'user': {
-                'id': 12345,
-                'name': 'Тестовый Пользователь',
-                'profile': {
-                    'age': 30,
-                    'city': 'Санкт-Петербург',
-                    'interests': ['programming', 'testing', 'automation']
-                }
-            },
-            'timestamp': datetime.now().isoformat(),
-            'test_type': 'json_post_test',
-            'numbers': [1, 2, 3, 4, 5],
-            'boolean_flag': True,
-            'null_value': None
-        }
+        test_data = {**_TEST_DATA_BASE, 'timestamp': test_timestamp}
         
-        response = self.session.post(
-            f"{self.BASE_URL}/post",
+        response = http_session.post(
+            self.POST_URL,
             json=test_data,
-            headers={'Content-Type': 'application/json'}
+            headers={'Content-Type': 'application/json'},
+            timeout=TIMEOUT
         )
         
-        assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
-        
-        data = response.json()
-        
-        assert 'data' in data, "В ответе должно быть поле 'data'"
-        assert 'json' in data, "В ответе должно быть поле 'json'"
-        assert 'headers' in data, "В ответе должно быть поле 'headers'"
-        
-        returned_json = data['json']
-        assert returned_json == test_data, "Возвращённые JSON данные не совпадают с отправленными"
-        
-        headers = data['headers']
-        assert 'content-type' in headers, "Заголовок Content-Type должен присутствовать"
-        assert 'application/json' in headers['content-type'], \
-            "Content-Type должен содержать application/json"
+        _assert_post_json(response, test_data)
     
-    def test_post_form_data(self):
+    def test_post_form_data(self, http_session):
         """
         Тест 4: POST запрос с form-data.
         
@@ -149,36 +293,11 @@ class TestPostmanEcho:
         - Корректную обработку форм
         - Специальные символы в form-data
         """
-        form_data = {
-            'username': 'test_user_123',
-            'password': 'SecurePassword!@#',
-            'email': 'user@тест.рф', 
-            'age': '28',
-            'terms_accepted': 'on',
-            'comments': 'Комментарий с кириллицей и спецсимволами: !@#$%^&*()'
-        }
-        
-        response = self.session.post(f"{self.BASE_URL}/post", data=form_data)
-        
-        assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
-        
-        data = response.json()
+        response = http_session.post(self.POST_URL, data=_FORM_DATA, timeout=TIMEOUT)
         
-        assert 'form' in data, "В ответе должно быть поле 'form'"
-        
-        returned_form = data['form']
-        
-        for key, expected_value in form_data.items():
-            assert key in returned_form, f"Поле формы '{key}' не найдено в ответе"
-            assert returned_form[key] == expected_value, \
-                f"Поле '{key}': ожидалось '{expected_value}', получено '{returned_form[key]}'"
-        
-        headers = data['headers']
-        assert 'content-type' in headers, "Заголовок Content-Type должен присутствовать"
-        assert 'application/x-www-form-urlencoded' in headers['content-type'], \
-            "Content-Type должен содержать application/x-www-form-urlencoded"
+        _assert_post_form(response, _FORM_DATA)
     
-    def test_get_with_custom_headers(self):
+    def test_get_with_custom_headers(self, http_session):
         """
         Тест 5: GET запрос с кастомными заголовками.
         
@@ -187,34 +306,13 @@ class TestPostmanEcho:
         - Echo пользовательских заголовков в ответе
         - Обработку заголовков с спецсимволами
         """
-        custom_headers = {
-            'X-Test-Header': 'TestValue123',
-            'X-User-Agent': 'CustomAgent/1.0',
-            'X-Request-ID': 'req_' + str(int(datetime.now().timestamp())),
-            'X-Client-Version': '2.1.0',
-            'X-Special-Chars': 'Value with spaces and symbols: !@#$%'
-        }
+        custom_headers = _custom_headers()
         
-        response = self.session.get(f"{self.BASE_URL}/get", headers=custom_headers)
+        response = http_session.get(self.GET_URL, headers=custom_headers, timeout=TIMEOUT)
         
-        assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
-        
-        data = response.json()
-        
-        assert 'headers' in data, "В ответе должно быть поле 'headers'"
-        
-        returned_headers = data['headers']
-        
-        found_custom_headers = 0
-        for header_name, expected_value in custom_headers.items():
-            header_name_lower = header_name.lower()
-            if header_name_lower in returned_headers:
-                found_custom_headers += 1
-                assert returned_headers[header_name_lower] == expected_value
-    
-        assert found_custom_headers >= 2, "Не найдено хотя бы 2 кастомных заголовка"
+        _assert_custom_headers(response, custom_headers)
 
-    def test_get_with_multiple_query_parameters(self):
+    def test_get_with_multiple_query_parameters(self, http_session):
         """
         Тест 6: GET запрос с множественными query параметрами.
         
@@ -223,57 +321,12 @@ class TestPostmanEcho:
         - Различные типы значений в параметрах
         - Корректную обработку массивов в query string
         """
-        query_params = {
-            'search': 'python testing',
-            'category': 'programming',
-            'level': 'advanced',
-            'duration_min': '30',
-            'duration_max': '120',
-            'language': 'ru',
-            'format': 'json',
-            'sort_by': 'relevance',
-            'order': 'desc',
-            'page': '1',
-            'limit': '20',
-            'include_archived': 'false',
-            'tags': 'api,testing,automation'
-        }
-        
-        response = self.session.get(f"{self.BASE_URL}/get", params=query_params)
-        
-        assert response.status_code == 200, f"Ожидался статус 200, получен {response.status_code}"
+        response = http_session.get(self.GET_URL, params=_QUERY_PARAMS, timeout=TIMEOUT)
         
-        data = response.json()
-        
-        returned_args = data['args']
-        
-        assert len(returned_args) == len(query_params), \
-            f"Количество параметров не совпадает: ожидалось {len(query_params)}, получено {len(returned_args)}"
-        
-        for param_name, expected_value in query_params.items():
-            assert param_name in returned_args, f"Параметр '{param_name}' не найден в ответе"
-            assert returned_args[param_name] == expected_value, \
-                f"Параметр '{param_name}': ожидалось '{expected_value}', получено '{returned_args[param_name]}'"
-        
-        url = data['url']
-        for param_name in query_params.keys():
-            assert param_name in url, f"Параметр '{param_name}' не найден в URL: {url}"
-    
-
-
-class TestPostmanEchoNegative:
-    """Класс с негативными тестами для Postman Echo API."""
-    
-    BASE_URL = "https://postman-echo.com"
-    TIMEOUT = 30
-    
-    @pytest.fixture(autouse=True)
-    def setup_session(self):
-        """Настройка сессии для негативных тестов."""
-        self.session = requests.Session()
-        self.session.timeout = self.TIMEOUT
+        _assert_multiple_query_parameters(response, _QUERY_PARAMS)
     
-    def test_invalid_endpoint(self):
+    @pytest.mark.slow
+    def test_invalid_endpoint(self, http_session):
         """
         Тест 7: Запрос к несуществующему endpoint.
         
@@ -281,7 +334,7 @@ class TestPostmanEchoNegative:
         - Корректную обработку 404 ошибок
         - Структуру ответа при ошибке
         """
-        response = self.session.get(f"{self.BASE_URL}/nonexistent-endpoint")
+        response = http_session.get(f"{self.BASE_URL}/nonexistent-endpoint", timeout=TIMEOUT)
         
         assert response.status_code == 404, f"Ожидался статус 404, получен {response.status_code}"
         
@@ -290,16 +343,122 @@ class TestPostmanEchoNegative:
 
         if len(response.content) > 0:
             assert 'content-type' in response.headers, "Заголовок Content-Type должен присутствовать"
+    
+    def test_connection_reuse(self, http_session):
+        """
+        Тест 8: Переиспользование соединения между запросами.
+        
+        Проверяет:
+        - Работу keep-alive: повторный запрос идёт по тому же сокету
+        """
+        # stream=True оставляет соединение занятым до чтения тела, поэтому сокет
+        # снимаем до .content; после чтения соединение возвращается в пул
+        first = http_session.get(self.GET_URL, timeout=TIMEOUT, stream=True)
+        first_sock = first.raw._fp.fp.raw._sock
+        assert first.status_code == 200, f"Ожидался статус 200, получен {first.status_code}"
+        first.content
+        
+        second = http_session.get(self.GET_URL, timeout=TIMEOUT, stream=True)
+        second_sock = second.raw._fp.fp.raw._sock
+        assert second.status_code == 200, f"Ожидался статус 200, получен {second.status_code}"
+        second.content
+        
+        # Пул переоткрывает разорванное соединение в том же объекте HTTPConnection,
+        # поэтому счётчики пула разрыв не видят, а новый сокет - видно
+        assert second_sock is first_sock, \
+            "Повторный запрос открыл новое соединение вместо переиспользования keep-alive"
+
+
+
+class TestPostmanEchoAsync:
+    """Асинхронный вариант позитивных тестов: все запросы отправляются параллельно."""
+
+    async def _check_get_basic(self, client):
+        response = await client.get("/get")
+        _assert_get_basic(response, str(client.base_url.join("/get")))
+
+    async def _check_get_query_parameters(self, client):
+        response = await client.get("/get", params=_BASIC_PARAMS)
+        _assert_query_parameters(response, _BASIC_PARAMS)
+
+    async def _check_post_json(self, client, test_timestamp):
+        test_data = {**_TEST_DATA_BASE, 'timestamp': test_timestamp}
+        response = await client.post("/post", json=test_data)
+        _assert_post_json(response, test_data)
+
+    async def _check_post_form(self, client):
+        response = await client.post("/post", data=_FORM_DATA)
+        _assert_post_form(response, _FORM_DATA)
+
+    async def _check_custom_headers(self, client):
+        custom_headers = _custom_headers()
+        response = await client.get("/get", headers=custom_headers)
+        _assert_custom_headers(response, custom_headers)
+
+    async def _check_multiple_query_parameters(self, client):
+        response = await client.get("/get", params=_QUERY_PARAMS)
+        _assert_multiple_query_parameters(response, _QUERY_PARAMS)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_positive_requests_concurrently(self, async_client, test_timestamp):
+        """
+        Тест 9: Все позитивные сценарии одновременно.
+
+        Проверяет:
+        - Корректность ответов при параллельных запросах
+        """
+        checks = {
+            'get_basic': self._check_get_basic(async_client),
+            'get_query_parameters': self._check_get_query_parameters(async_client),
+            'post_json': self._check_post_json(async_client, test_timestamp),
+            'post_form': self._check_post_form(async_client),
+            'custom_headers': self._check_custom_headers(async_client),
+            'multiple_query_parameters': self._check_multiple_query_parameters(async_client),
+        }
+        # Дожидаемся всех сценариев, чтобы в отчёт попали все падения, а не только первое
+        results = await asyncio.gather(*checks.values(), return_exceptions=True)
+        
+        failures = [
+            f"{name}: {type(result).__name__}: {result}"
+            for name, result in zip(checks, results)
+            if isinstance(result, BaseException)
+        ]
+        assert not failures, "Упали сценарии:\n" + "\n".join(failures)
 
 
 
 pytest_plugins = []
 
 
-def pytest_configure(config):
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
+@pytest.fixture(scope="session")
+def http_session():
+    """Общая HTTP-сессия на весь прогон: переиспользует keep-alive соединение."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=20, max_retries=Retry(total=0, read=False))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'PostmanEcho-AutoTest/1.0',
+        'Accept': 'application/json',
+        'Connection': 'keep-alive'
+    })
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm(http_session, api_base_url):
+    """Проверяет доступность сервиса и заранее открывает TLS соединение."""
+    try:
+        http_session.head(api_base_url, timeout=5)
+    except requests.RequestException:
+        pytest.skip("postman-echo unreachable")
+
+
+@pytest.fixture(scope="session")
+def baseline_get_response(http_session, api_base_url):
+    """Ответ на GET /get без параметров, запрашивается один раз за прогон."""
+    return http_session.get(f"{api_base_url}/get", timeout=TIMEOUT)
 
 
 @pytest.fixture(scope="session")
@@ -308,6 +467,22 @@ def api_base_url():
     return "https://postman-echo.com"
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(api_base_url):
+    """Асинхронный HTTP/2 клиент, общий для всех асинхронных тестов."""
+    async with httpx.AsyncClient(
+        http2=True,
+        base_url=api_base_url,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=4),
+        headers={
+            'User-Agent': 'PostmanEcho-AutoTest/1.0',
+            'Accept': 'application/json'
+        }
+    ) as client:
+        yield client
+
+
 @pytest.fixture
 def test_timestamp():
     """Фикстура с временной меткой для тестов."""